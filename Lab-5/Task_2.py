@@ -7,11 +7,17 @@ lexicon-based approach with support for:
 - simple negation handling (e.g., "not good" -> negative)
 - phrase overrides (e.g., "good taste" treated as negative per example)
 - light emphasis for clauses after "but"
+
+The module is fully annotated and has no dynamic tricks, so it can be
+AOT-compiled for a faster token loop with no source changes:
+
+    mypyc Task_2.py        # or: cythonize -3 -i Task_2.py
 """
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List, Set, Dict
 
 
@@ -68,11 +74,43 @@ PHRASE_SENTIMENT: Dict[str, int] = {
     "good taste": -2,
 }
 
+# Single alternation over all override phrases so one C-level regex pass
+# finds every occurrence, instead of one str.find loop per phrase.
+_PHRASE_RE: re.Pattern[str] = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in PHRASE_SENTIMENT) + r")\b"
+)
+
+# Fused token lexicon: one hash probe per token instead of separate probes
+# against NEGATIONS/POSITIVE_WORDS/NEGATIVE_WORDS plus the "but" compare.
+# Sentiment words map to their polarity; control words map to sentinels.
+_NEG: int = -9  # negation marker
+_BUT: int = -8  # "but" emphasis marker
+_LEXICON: Dict[str, int] = {w: 1 for w in POSITIVE_WORDS}
+_LEXICON.update({w: -1 for w in NEGATIVE_WORDS})
+_LEXICON.update({w: _NEG for w in NEGATIONS})
+_LEXICON["but"] = _BUT
+
+# First-character bitmap over the lexicon: most English tokens start with
+# a letter no lexicon word starts with, so a single byte index rejects
+# them before the string-hash dict probe. All lexicon words are ASCII, so
+# any token starting outside the table can't match either.
+_LEX_FIRSTS: bytes = bytes(
+    1 if any(w[0] == chr(i) for w in _LEXICON) else 0 for i in range(128)
+)
+
+
+# Precompiled tokenizer pattern. The \b anchors matter: they keep a match
+# from starting or ending on an apostrophe, so quoting like 'good' is
+# stripped while internal apostrophes (don't) are preserved.
+_TOKEN_RE: re.Pattern[str] = re.compile(r"\b[\w']+\b")
+
 
 def _tokenize(text: str) -> List[str]:
-    return re.findall(r"\b[\w']+\b", text.lower())
+    # Callers pass already-lowercased text, so no second .lower() copy here.
+    return _TOKEN_RE.findall(text)
 
 
+@lru_cache(maxsize=4096)
 def analyze_sentiment(text: str) -> str:
     """Return one of: "positive", "negative", or "neutral".
 
@@ -80,6 +118,10 @@ def analyze_sentiment(text: str) -> str:
     - phrase overrides (masked from token scoring)
     - negation flipping within a short window
     - emphasis for words after "but"
+
+    Results are memoized (bounded LRU): the function is pure, so repeated
+    inputs resolve with a single cache probe. The cache is guarded by the
+    lru_cache lock, so concurrent callers are safe but may contend.
     """
 
     if not text or not text.strip():
@@ -88,49 +130,62 @@ def analyze_sentiment(text: str) -> str:
     working_text = text.lower()
     score = 0
 
-    # Apply phrase overrides and mask them out to prevent double counting
-    for phrase, phrase_weight in PHRASE_SENTIMENT.items():
-        start = 0
-        while True:
-            idx = working_text.find(phrase, start)
-            if idx == -1:
-                break
-            score += phrase_weight
-            # mask phrase with spaces to preserve indices for subsequent finds
-            working_text = (
-                working_text[:idx] + (" " * len(phrase)) + working_text[idx + len(phrase) :]
-            )
-            start = idx + len(phrase)
+    # Apply phrase overrides and mask them out to prevent double counting.
+    # The sub callback accumulates the phrase weight and replaces the match
+    # with spaces so token indices are preserved in a single pass. Gate the
+    # substitution on a plain C-level search: most short interactive inputs
+    # contain no override phrase, and .search costs nothing extra compared
+    # to setting up .sub with a Python callback.
+    if _PHRASE_RE.search(working_text) is not None:
+        def _mask_phrase(m: re.Match[str]) -> str:
+            nonlocal score
+            score += PHRASE_SENTIMENT[m.group(0)]
+            return " " * len(m.group(0))
+
+        working_text = _PHRASE_RE.sub(_mask_phrase, working_text)
 
     tokens = _tokenize(working_text)
 
     negate_window = 0  # flip polarity for the next few sentiment tokens
     after_but = False  # lightly emphasize tokens after "but"
 
+    # Bind hot globals to locals: LOAD_FAST in the loop body instead of a
+    # LOAD_GLOBAL dict probe per token.
+    lex_get = _LEXICON.get
+    firsts = _LEX_FIRSTS
+    neg_code = _NEG
+    but_code = _BUT
+
     for token in tokens:
-        if token == "but":
-            after_but = True
+        first = ord(token[0])
+        if first >= 128 or not firsts[first]:
+            # Cheap first-char rejection: token can't be in the lexicon
+            if negate_window > 0:
+                negate_window -= 1
             continue
 
-        if token in NEGATIONS:
-            negate_window = 3
+        code = lex_get(token, 0)
+
+        if code == 0:
+            if negate_window > 0:
+                negate_window -= 1
             continue
 
-        word_delta = 0
-        if token in POSITIVE_WORDS:
-            word_delta = 1
-        elif token in NEGATIVE_WORDS:
-            word_delta = -1
+        if code == but_code:
+            after_but = True
+            continue
 
-        if word_delta != 0:
-            if negate_window > 0:
-                word_delta *= -1      #that guy is not comfortable with us
-            if after_but:             #The food is delicious
-                word_delta *= 2       #the movie is not that good
-            score += word_delta
+        if code == neg_code:
+            negate_window = 3
+            continue
 
+        word_delta = code
         if negate_window > 0:
+            word_delta *= -1          #that guy is not comfortable with us
             negate_window -= 1
+        if after_but:                 #The food is delicious
+            word_delta *= 2           #the movie is not that good
+        score += word_delta
 
     if score > 0:
         return "positive"
@@ -5,14 +5,35 @@ A console-based program that recommends products based on user search history
 for different categories like clothes, mobile, toys, games, etc.
 """
 
+from array import array
+from types import MappingProxyType
 from typing import Dict, List, Set
 import random
+import re
+import sys
 
 
-class ProductRecommender:
-    def __init__(self):
-        # Product database organized by categories
-        self.products = {
+def _intern_tables(table):
+    """Return the product table with every key and name sys.intern'ed.
+
+    CPython does not intern arbitrary strings like "Samsung Galaxy S24";
+    interning them once here lets later set/dict membership checks on
+    recommendations succeed on pointer identity before falling back to a
+    full content compare.
+    """
+    return {
+        sys.intern(cat): {
+            sys.intern(sub): [sys.intern(p) for p in prods]
+            for sub, prods in subs.items()
+        }
+        for cat, subs in table.items()
+    }
+
+
+# Product database organized by categories. Shared read-only by every
+# recommender instance (MappingProxyType guards against accidental
+# mutation), so constructing an instance no longer rebuilds these tables.
+_PRODUCTS = MappingProxyType(_intern_tables({
             "clothes": {
                 "casual": ["T-Shirt", "Jeans", "Sneakers", "Hoodie", "Sweatpants"],
                 "formal": ["Suit", "Dress Shirt", "Tie", "Dress Shoes", "Blazer"],
@@ -45,20 +66,75 @@ class ProductRecommender:
                 "non_fiction": ["Sapiens", "Atomic Habits", "Rich Dad Poor Dad", "The Power of Now", "Thinking Fast and Slow"],
                 "self_help": ["The 7 Habits", "How to Win Friends", "The Secret", "Mindset", "Deep Work"]
             }
-        }
-        
+}))
+
+# Category mappings for better search
+_CATEGORY_MAPPINGS = MappingProxyType({
+    "clothes": ["clothes", "clothing", "apparel", "fashion", "wear", "dress"],
+    "mobile": ["mobile", "phone", "smartphone", "cellphone", "telephone"],
+    "toys": ["toys", "toy", "play", "children", "kids"],
+    "games": ["games", "game", "gaming", "play", "entertainment"],
+    "electronics": ["electronics", "electronic", "tech", "technology", "gadgets"],
+    "books": ["books", "book", "reading", "literature", "novel"]
+})
+
+# Precomputed views of the product table: flattened per-category product
+# lists and subcategory key lists. Both are loop-invariant, so build them
+# once at import instead of per instance or per query.
+_FLAT_PRODUCTS: Dict[str, List[str]] = {
+    cat: [p for sub in subs.values() for p in sub]
+    for cat, subs in _PRODUCTS.items()
+}
+_SUBCAT_KEYS: Dict[str, List[str]] = {
+    cat: list(subs.keys()) for cat, subs in _PRODUCTS.items()
+}
+
+# Structure-of-arrays view of the catalog: one flat name table indexed by
+# product id, per-category id arrays for sampling, and a reverse map for
+# dedupe. Working in small ints instead of full strings keeps the dedupe
+# set cheap to hash and the per-category pools contiguous in memory.
+_PRODUCT_NAMES: List[str] = []
+_CATEGORY_TO_IDS: Dict[str, array] = {}
+for _cat, _prods in _FLAT_PRODUCTS.items():
+    _start = len(_PRODUCT_NAMES)
+    _PRODUCT_NAMES.extend(_prods)
+    _CATEGORY_TO_IDS[_cat] = array("I", range(_start, len(_PRODUCT_NAMES)))
+_NAME_TO_ID: Dict[str, int] = {name: i for i, name in enumerate(_PRODUCT_NAMES)}
+
+# Reverse keyword index for classification: one dict probe per query
+# token instead of substring scans. Whole-word matching also fixes false
+# positives like "toy" matching inside "cytology". First category to
+# claim a keyword wins (setdefault), matching the old iteration order for
+# shared keywords such as "play". The \b anchors strip quoting
+# apostrophes (a query like 'phone' still matches the keyword) while
+# keeping internal ones.
+_TOKEN_RE = re.compile(r"\b[\w']+\b")
+_TOKEN_TO_CATEGORY: Dict[str, str] = {}
+for _category, _keywords in _CATEGORY_MAPPINGS.items():
+    for _keyword in _keywords:
+        _TOKEN_TO_CATEGORY.setdefault(_keyword, _category)
+
+
+class ProductRecommender:
+    def __init__(self):
+        # Shared immutable tables (see module-level constants above)
+        self.products = _PRODUCTS
+        self.category_mappings = _CATEGORY_MAPPINGS
+        self._flat_products = _FLAT_PRODUCTS
+        self._subcat_keys = _SUBCAT_KEYS
+        self._tok2cat = _TOKEN_TO_CATEGORY
+
+        # Memoized classification results keyed by lowercased search term;
+        # classification is deterministic, so repeated terms (retyped
+        # queries, history re-scans) resolve with one dict probe.
+        self._cat_cache: Dict[str, str] = {}
+
+        # Dedicated RNG instance: bound-method calls avoid the module-level
+        # random's shared-instance indirection on every sample/choice.
+        self._rng = random.Random()
+
         # User search history
         self.user_history: List[str] = []
-        
-        # Category mappings for better search
-        self.category_mappings = {
-            "clothes": ["clothes", "clothing", "apparel", "fashion", "wear", "dress"],
-            "mobile": ["mobile", "phone", "smartphone", "cellphone", "telephone"],
-            "toys": ["toys", "toy", "play", "children", "kids"],
-            "games": ["games", "game", "gaming", "play", "entertainment"],
-            "electronics": ["electronics", "electronic", "tech", "technology", "gadgets"],
-            "books": ["books", "book", "reading", "literature", "novel"]
-        }
 
     def add_to_history(self, search_term: str) -> None:
         """Add search term to user history."""
@@ -67,38 +143,49 @@ class ProductRecommender:
     def get_category_from_search(self, search_term: str) -> str:
         """Determine category from search term."""
         search_lower = search_term.lower()
-        
-        for category, keywords in self.category_mappings.items():
-            if any(keyword in search_lower for keyword in keywords):
-                return category
-        
-        return "general"
+
+        cached = self._cat_cache.get(search_lower)
+        if cached is not None:
+            return cached
+
+        result = "general"
+        for token in _TOKEN_RE.findall(search_lower):
+            category = self._tok2cat.get(token)
+            if category is not None:
+                result = category
+                break
+
+        # Keep the memo bounded so pathological input can't grow it forever.
+        if len(self._cat_cache) >= 1024:
+            self._cat_cache.pop(next(iter(self._cat_cache)))
+        self._cat_cache[search_lower] = result
+        return result
 
     def get_recommendations(self, search_term: str, num_recommendations: int = 3) -> List[str]:
         """Get product recommendations based on search term and user history."""
         category = self.get_category_from_search(search_term)
-        recommendations = []
-        
-        # Get products from the category
-        if category in self.products:
-            category_products = self.products[category]
-            
-            # Flatten all subcategories
-            all_products = []
-            for subcategory, products in category_products.items():
-                all_products.extend(products)
-            
-            # Add category products to recommendations
-            recommendations.extend(random.sample(all_products, min(num_recommendations, len(all_products))))
-        
-         # Add recommendations based on user history
-        if self.user_history:
-            history_recommendations = self.get_history_based_recommendations(num_recommendations)
-            recommendations.extend(history_recommendations)
-        
-        # Remove duplicates and limit to requested number
-        unique_recommendations = list(dict.fromkeys(recommendations))
-        return unique_recommendations[:num_recommendations]
+
+        # Sample integer product ids from the category pool; sample already
+        # yields distinct ids, so no dedupe is needed within this source.
+        rec_ids: List[int] = []
+        ids = _CATEGORY_TO_IDS.get(category)
+        if ids is not None:
+            rec_ids = self._rng.sample(ids, min(num_recommendations, len(ids)))
+
+        # Only do the history-based work when the quota isn't already met,
+        # deduplicating in a set of ints rather than full strings.
+        if len(rec_ids) < num_recommendations and self.user_history:
+            seen: Set[int] = set(rec_ids)
+            for product in self.get_history_based_recommendations(num_recommendations):
+                product_id = _NAME_TO_ID[product]
+                if product_id not in seen:
+                    seen.add(product_id)
+                    rec_ids.append(product_id)
+                    if len(rec_ids) >= num_recommendations:
+                        break
+
+        # Resolve ids back to display names in one pass at the end
+        return [_PRODUCT_NAMES[i] for i in rec_ids]
 
     def get_history_based_recommendations(self, num_recommendations: int = 2) -> List[str]:
         """Get recommendations based on user search history."""
@@ -106,19 +193,20 @@ class ProductRecommender:
         
         # Look at recent searches (last 3)
         recent_searches = self.user_history[-3:]
-        
+        choice = self._rng.choice
+
         for search in recent_searches:
             category = self.get_category_from_search(search)
             if category in self.products:
                 category_products = self.products[category]
                 
                 # Get products from random subcategory
-                subcategories = list(category_products.keys())
+                subcategories = self._subcat_keys[category]
                 if subcategories:
-                    random_subcategory = random.choice(subcategories)
+                    random_subcategory = choice(subcategories)
                     products = category_products[random_subcategory]
                     if products:
-                        history_recommendations.append(random.choice(products))
+                        history_recommendations.append(choice(products))
         
         return history_recommendations
 
@@ -1,9 +1,43 @@
 import hashlib
 import getpass
+import os
+
+# Secret key for pseudonymization, taken from the environment. An unkeyed
+# hash of PII is reversible by rainbow-table lookup; with a key set, the
+# digests are a proper MAC (BLAKE2b keyed mode, equivalent to HMAC but
+# without the extra inner/outer compression passes). An empty key falls
+# back to plain hashing so the script still runs without setup.
+_KEY = os.environ.get("ANON_KEY", "").encode("utf-8")
+
+# Preinitialized hasher state shared by every call: copying it is cheaper
+# than constructing a fresh BLAKE2b object per field, which matters when
+# hashing many short inputs. The personalization tag domain-separates
+# these digests from other BLAKE2b uses.
+_PROTOTYPE = hashlib.blake2b(digest_size=32, key=_KEY, person=b"user_anon")
 
 def anonymize(text):
-    # Hash the input text using SHA-256
-    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    # Hash the input text with BLAKE2b (256-bit digest). Same collision
+    # resistance as SHA-256 for pseudonymization, but noticeably faster
+    # per call on CPUs without SHA hardware extensions.
+    h = _PROTOTYPE.copy()
+    h.update(text.encode('utf-8'))
+    return h.hexdigest()
+
+def _format_record(name, age, email):
+    # Anonymize sensitive fields and render the whole record as one string
+    return (
+        f"Name: {anonymize(name)}\n"
+        f"Age: {age}\n"
+        f"Email: {anonymize(email)}\n"
+        f"{'-' * 20}\n"
+    )
+
+def write_records(records):
+    # Batch ingestion: open the file once and issue one buffered write per
+    # record instead of four, amortizing the open/close and C-call costs.
+    with open("user_data.txt", "a", buffering=1 << 16) as f:
+        for name, age, email in records:
+            f.write(_format_record(name, age, email))
 
 def main():
     print("Enter your details:")
@@ -11,16 +45,8 @@ def main():
     age = input("Age: ")
     email = input("Email: ")
 
-    # Anonymize sensitive fields
-    anon_name = anonymize(name)
-    anon_email = anonymize(email)
-
     # Store anonymized data
-    with open("user_data.txt", "a") as f:
-        f.write(f"Name: {anon_name}\n")
-        f.write(f"Age: {age}\n")
-        f.write(f"Email: {anon_email}\n")
-        f.write("-" * 20 + "\n")
+    write_records([(name, age, email)])
 
     print("Your data has been securely stored and anonymized.")
 